@@ -6,15 +6,16 @@ import pandas as pd
 from sqlalchemy import create_engine
 from tqdm.auto import tqdm
 
+# Narrowest integer types that fit the TLC value ranges (location ids <= 265, small codes/counts)
 dtype = {
-    "VendorID": "Int64",
-    "passenger_count": "Int64",
+    "VendorID": "Int8",
+    "passenger_count": "Int8",
     "trip_distance": "float64",
-    "RatecodeID": "Int64",
-    "store_and_fwd_flag": "string",
-    "PULocationID": "Int64",
-    "DOLocationID": "Int64",
-    "payment_type": "Int64",
+    "RatecodeID": "Int8",
+    "store_and_fwd_flag": "string[pyarrow]",
+    "PULocationID": "Int16",
+    "DOLocationID": "Int16",
+    "payment_type": "Int8",
     "fare_amount": "float64",
     "extra": "float64",
     "mta_tax": "float64",
@@ -3,8 +3,9 @@ import requests
 from pathlib import Path
 
 BASE_URL = "https://github.com/DataTalksClub/nyc-tlc-data/releases/download"
+CHUNK_SIZE = 1024 * 1024
 
-def download_and_convert_files(taxi_type):
+def download_and_convert_files(taxi_type, session):
     data_dir = Path("data") / taxi_type
     data_dir.mkdir(exist_ok=True, parents=True)
 
@@ -21,12 +22,13 @@ def download_and_convert_files(taxi_type):
             csv_gz_filename = f"{taxi_type}_tripdata_{year}-{month:02d}.csv.gz"
             csv_gz_filepath = data_dir / csv_gz_filename
 
-            response = requests.get(f"{BASE_URL}/{taxi_type}/{csv_gz_filename}", stream=True)
-            response.raise_for_status()
+            # Stream the compressed payload straight to disk; DuckDB decompresses it while converting
+            with session.get(f"{BASE_URL}/{taxi_type}/{csv_gz_filename}", stream=True, timeout=60) as response:
+                response.raise_for_status()
 
-            with open(csv_gz_filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                with open(csv_gz_filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
 
             print(f"Converting {csv_gz_filename} to Parquet...")
             con = duckdb.connect()
@@ -55,8 +57,10 @@ if __name__ == "__main__":
     # Update .gitignore to exclude data directory
     update_gitignore()
 
-    for taxi_type in ["yellow", "green"]:
-        download_and_convert_files(taxi_type)
+    # Reuse one session so every month's download keeps the same TLS connections alive
+    with requests.Session() as session:
+        for taxi_type in ["yellow", "green"]:
+            download_and_convert_files(taxi_type, session)
 
     con = duckdb.connect("taxi_rides_ny.duckdb")
     con.execute("CREATE SCHEMA IF NOT EXISTS prod")
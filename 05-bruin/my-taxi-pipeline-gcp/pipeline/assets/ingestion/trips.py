@@ -48,10 +48,80 @@ columns:
 # Docs: https://getbruin.com/docs/bruin/assets/python
 import os
 import json
+import asyncio
+import functools
+from io import BytesIO
+import aiohttp
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from datetime import datetime
 
 
+@functools.lru_cache(maxsize=1)
+def _pipeline_vars():
+  # BRUIN_VARS is fixed for the whole run; tolerate it being unset or empty
+  return json.loads(os.environ.get('BRUIN_VARS') or '{}')
+
+
+def _parse(content, extracted_at):
+  df = pd.read_json(BytesIO(content))
+
+  # Add extracted_at column (a single datetime64 scalar, broadcast by pandas)
+  df['extracted_at'] = extracted_at
+
+  # Hand back an Arrow table so the final concat only stitches chunks together;
+  # mixed-type object columns cannot be converted, so keep those frames in pandas
+  try:
+    return pa.Table.from_pandas(df, preserve_index=False)
+  except (pa.ArrowInvalid, pa.ArrowTypeError):
+    return df
+
+
+async def _fetch(session, taxi_type, start_date, end_date, extracted_at):
+  # Example endpoint generation (modify as needed)
+  endpoint = f"https://api.example.com/taxis/{taxi_type}?start_date={start_date}&end_date={end_date}"
+
+  # Download without blocking the event loop so all taxi types are in flight at once
+  async with session.get(endpoint) as response:
+    response.raise_for_status()
+    content = await response.read()
+
+  # Parsing and Arrow conversion are CPU-bound: run them in a worker thread so the event loop
+  # only awaits I/O and the other downloads keep progressing
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(None, _parse, content, extracted_at)
+
+
+def _combine(parts):
+  # Fast path: concat Arrow tables without copying (permissive promotion upcasts e.g. int64 + double),
+  # then convert once; self_destruct frees Arrow buffers column by column so peak memory stays
+  # around one copy of the data
+  if all(isinstance(part, pa.Table) for part in parts):
+    try:
+      table = pa.concat_tables(parts, promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+      pass
+    else:
+      parts.clear()
+      return table.to_pandas(self_destruct=True, split_blocks=True)
+
+  # Fallback for types Arrow cannot reconcile: pd.concat upcasts to object where it has to
+  frames = [part.to_pandas() if isinstance(part, pa.Table) else part for part in parts]
+  return pd.concat(frames, ignore_index=True)
+
+
+async def _fetch_all(taxi_types, start_date, end_date, extracted_at):
+  # One shared session, with a connection slot per taxi type. Like requests' timeout=60, bound the
+  # connect and each socket read (so a stalled endpoint fails) but not the total download time
+  connector = aiohttp.TCPConnector(limit=len(taxi_types))
+  timeout = aiohttp.ClientTimeout(total=None, sock_connect=60, sock_read=60)
+  async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+    return await asyncio.gather(
+      *[_fetch(session, taxi_type, start_date, end_date, extracted_at) for taxi_type in taxi_types]
+    )
+
+
 # TODO: Only implement `materialize()` if you are using Bruin Python materialization.
 # If you choose the manual-write approach (no `materialization:` block), remove this function and implement ingestion
 # as a standard Python script instead.
@@ -62,26 +132,17 @@ def materialize():
   end_date = os.getenv('BRUIN_END_DATE')
   
   # Read pipeline variables
-  taxi_types = json.loads(os.getenv('BRUIN_VARS')).get('taxi_types', [])
-
-  # Initialize an empty list to hold DataFrames
-  dataframes = []
-
-  # Generate source endpoints based on taxi types and date range
-  for taxi_type in taxi_types:
-    # Example endpoint generation (modify as needed)
-    endpoint = f"https://api.example.com/taxis/{taxi_type}?start_date={start_date}&end_date={end_date}"
-    
-    # Fetch data (this is a placeholder; implement actual data fetching)
-    response = pd.read_json(endpoint)
-    
-    # Add extracted_at column
-    response['extracted_at'] = datetime.now()
-    
-    # Append the DataFrame to the list
-    dataframes.append(response)
-
-  # Concatenate all DataFrames into a single DataFrame
-  final_dataframe = pd.concat(dataframes, ignore_index=True)
+  taxi_types = _pipeline_vars().get('taxi_types', [])
+  if not taxi_types:
+    raise ValueError("No taxi types to ingest: set the `taxi_types` pipeline variable (BRUIN_VARS)")
+
+  # Stamp every row of this run with the same extraction time, computed once
+  extracted_at = np.datetime64(datetime.now(), 'us')
+
+  # Fetch all taxi types concurrently (one Arrow table per taxi type)
+  parts = asyncio.run(_fetch_all(taxi_types, start_date, end_date, extracted_at))
+
+  # Concatenate all taxi types into a single DataFrame
+  final_dataframe = _combine(parts)
 
   return final_dataframe
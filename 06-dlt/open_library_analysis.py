@@ -13,7 +13,6 @@ app = marimo.App(width="medium")
 def _():
     import dlt
     import ibis
-    import pandas as pd
     import plotly.express as px
     import marimo as mo
 
@@ -48,9 +47,9 @@ def _(ibis, ibis_conn):
         .limit(10)
     )
 
-    # Execute the query and convert to pandas
-    top_authors_df = author_counts.to_pandas()
-    return (top_authors_df,)
+    # Execute the query in DuckDB and fetch the result as Arrow (no pandas conversion)
+    top_authors_tbl = author_counts.to_pyarrow()
+    return (top_authors_tbl,)
 
 
 @app.cell
@@ -63,18 +62,18 @@ def _(mo):
 
 
 @app.cell
-def _(mo, top_authors_df):
+def _(mo, top_authors_tbl):
     # Show the data table
-    mo.ui.table(top_authors_df)
+    mo.ui.table(top_authors_tbl)
     return
 
 
 @app.cell
-def _(mo, px, top_authors_df):
+def _(mo, px, top_authors_tbl):
     # Create a bar chart visualization
-    if len(top_authors_df) > 0:
+    if len(top_authors_tbl) > 0:
         fig = px.bar(
-            top_authors_df,
+            top_authors_tbl,
             x='book_count',
             y='name',
             orientation='h',
@@ -68,6 +68,7 @@ if __name__ == "__main__":
     if MAX_RECORDS > 0:
         print(f"Limiting extract to {MAX_RECORDS} records (set TAXI_PIPELINE_MAX_RECORDS=0 for full run).")  # noqa: T201
     print(f"DuckDB database: {DUCKDB_PATH}")  # noqa: T201
-    load_info = taxi_pipeline.run(taxi_rest_api_source())
+    # Parquet load files are ingested by DuckDB natively instead of row-by-row inserts
+    load_info = taxi_pipeline.run(taxi_rest_api_source(), loader_file_format="parquet")
     print(load_info)  # noqa: T201
 